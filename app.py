@@ -1,8 +1,23 @@
 # app.py (root of repo)
 
+import os
+
 import uvicorn
 from src.main import app  # this imports the FastAPI instance from app/main.py
 
 if __name__ == "__main__":
     # S2I Python image will run: python app.py
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop + httptools both ship with uvicorn[standard].
+    # Contracts are kept in-process, so each worker has its own store -- only
+    # raise WEB_CONCURRENCY once that lives somewhere shared.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        "src.main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8080,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        log_level="warning",
+        access_log=False,
+    )
@@ -0,0 +1,27 @@
+"""
+Optional native build: compiles src/models.py and src/main.py with Cython.
+
+    pip install Cython
+    python setup.py build_ext --inplace
+
+The .so files land next to the .py sources and take precedence on import;
+delete them to go back to plain Python for development.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="redguard-backend",
+    ext_modules=cythonize(
+        [
+            Extension("src.models", ["src/models.py"]),
+            Extension("src.main", ["src/main.py"]),
+        ],
+        compiler_directives={
+            "language_level": 3,
+            # Treat annotations as hints only -- otherwise Cython rejects
+            # msgspec Struct classes where a parameter is annotated `type`.
+            "annotation_typing": False,
+        },
+    ),
+)
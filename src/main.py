@@ -1,12 +1,33 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Dict
+from fastapi.concurrency import run_in_threadpool
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import Response
+from typing import Any, BinaryIO, List, NamedTuple, Optional, Dict, Tuple
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
 import os
+import time
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 
 import httpx  # NEW: for async HTTP calls
+import msgspec
+from cachetools import Cache, LRUCache
+
+from .middleware import FastPathCORSMiddleware
+from .models import (
+    CategoryScore,
+    ChatCompletion,
+    ContractAnalysis,
+    ContractListItem,
+    ContractListResponse,
+    ExecutiveSummary,
+    FeedbackRequest,
+    LLMAnalysis,
+    Report,
+    Summary,
+)
 
 # ---------- Config ----------
 
@@ -14,6 +35,12 @@ DEEPSEEK_API_URL = "https://api.deepseek.com/chat/completions"  # adjust if need
 DEEPSEEK_MODEL = "deepseek-chat"
 PROMPT_PATH = os.getenv("PROMPT_PATH", "prompt.txt")  # NEW: path to prompt file
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")      # NEW: injected via OpenShift secret
+CONTRACTS_CACHE_SIZE = int(os.getenv("CONTRACTS_CACHE_SIZE", "256"))
+# Cached LLM results hold the full document too; stored contracts share them,
+# so at most CONTRACTS_CACHE_SIZE + LLM_CACHE_SIZE analyses are kept in memory.
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", str(CONTRACTS_CACHE_SIZE)))
+LLM_CHUNK_CHARS = int(os.getenv("LLM_CHUNK_CHARS", "40000"))  # longer texts are split
+LLM_MAX_PARALLEL = int(os.getenv("LLM_MAX_PARALLEL", "8"))    # concurrent parts per contract
 
 # Load system prompt once at startup
 def load_prompt() -> str:
@@ -24,234 +51,286 @@ def load_prompt() -> str:
 
 SYSTEM_PROMPT = load_prompt()  # NEW
 
+# Both are fixed for the lifetime of the process, so build them once.
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+HEADERS = {
+    "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
+    "Content-Type": "application/json",
+}
 
-# ---------- Models ----------
-
-RiskLevel = Literal["low", "medium", "high"]
-
-
-class CategoryScore(BaseModel):
-    name: str
-    value: int
-
-
-class TopRisk(BaseModel):
-    id: int
-    level: RiskLevel
-    category: str
-    title: str
-    description: str
-    section: Optional[str] = None
-    impact: Optional[str] = None
-    recommendation: Optional[str] = None
-    tags: List[str] = []
-
-
-class Summary(BaseModel):
-    overallRisk: RiskLevel
-    riskScore: int = Field(ge=0, le=100)
-    criticalIssues: int
-    mediumIssues: int
-    lowIssues: int
-    recommendation: str
-
-
-class IssueDetail(BaseModel):
-    id: str
-    type: str
-    severity: RiskLevel
-    snippet: str
-    explanation: str
-    suggestedFix: Optional[str] = None
-
-
-class Section(BaseModel):
-    id: str
-    heading: Optional[str] = None
-    text: str
-    riskLevel: RiskLevel
-    riskTags: List[str] = []
-    issues: List[IssueDetail] = []
-
-
-class DocumentInfo(BaseModel):
-    name: str
-    date: Optional[str] = None
-    parties: List[str] = []
-    reviewDate: Optional[str] = None
-    analyst: Optional[str] = None
 
+# strict=False keeps Pydantic's lax coercion (e.g. "80" -> 80) for LLM output.
+LLM_DECODER = msgspec.json.Decoder(LLMAnalysis, strict=False)
+COMPLETION_DECODER = msgspec.json.Decoder(ChatCompletion)
+JSON_ENCODER = msgspec.json.Encoder()
 
-class ReportIssue(BaseModel):
-    id: int
-    category: str
-    severity: str
-    title: str
-    status: str
-    owner: Optional[str] = None
-    dueDate: Optional[str] = None
 
+def struct_response(obj: msgspec.Struct) -> Response:
+    return Response(content=JSON_ENCODER.encode(obj), media_type="application/json")
 
-class ExecutiveSummary(BaseModel):
-    overallRisk: str
-    riskScore: int
-    criticalIssues: int
-    mediumIssues: int
-    lowIssues: int
-    recommendation: str
 
+_LAST_TS: List[Any] = [0, None]  # [epoch second, datetime for that second]
 
-class Report(BaseModel):
-    documentInfo: DocumentInfo
-    executiveSummary: ExecutiveSummary
-    issues: List[ReportIssue]
-    mitigationPlan: List[str]
-    signingRecommendation: str
-
-
-class Improvement(BaseModel):
-    id: int
-    category: str
-    level: RiskLevel
-    original: str
-    improved: str
-    rationale: str
-    status: Literal["suggested", "accepted", "rejected"] = "suggested"
-
-
-class Change(BaseModel):
-    id: int
-    type: Literal["added", "removed", "modified"]
-    section: str
-    original: Optional[str] = None
-    revised: Optional[str] = None
-    impact: RiskLevel
-    description: str
-    status: str
-
-
-class ContractAnalysis(BaseModel):
-    contractId: str
-    fileName: str
-    uploadedAt: str
-    summary: Summary
-    categories: List[CategoryScore]
-    topRisks: List[TopRisk]
-    document: Dict[str, object]
-    improvements: List[Improvement]
-    changes: List[Change]
-    report: Report
-
-
-class ContractListItem(BaseModel):
-    contractId: str
-    fileName: str
-    uploadedAt: str
-    overallRisk: RiskLevel
-    riskScore: int
 
+def utc_now() -> datetime:
+    """
+    Current UTC time at one-second resolution. Requests landing in the same
+    second share one (immutable) datetime instead of each building their own.
+    """
+    now = int(time.time())
+    if now != _LAST_TS[0]:
+        _LAST_TS[1] = datetime.fromtimestamp(now, timezone.utc)
+        _LAST_TS[0] = now
+    return _LAST_TS[1]
 
-class ContractListResponse(BaseModel):
-    items: List[ContractListItem]
 
+# ---------- LLM client (DeepSeek) ----------
 
-class FeedbackRequest(BaseModel):
-    issueId: str
-    type: Literal["false_positive", "helpful", "not_helpful"]
-    comment: Optional[str] = None
+# Shared client so connections (and TLS sessions) to DeepSeek are reused across
+# requests; opened/closed by the app lifespan below.
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
 
+# Exact-match cache of LLM results, keyed by a hash of the contract text.
+LLM_CACHE: LRUCache = LRUCache(maxsize=LLM_CACHE_SIZE)
 
-class HealthResponse(BaseModel):
-    status: str = "ok"
 
+def contract_cache_key(contract_text: str) -> str:
+    return hashlib.blake2b(contract_text.encode("utf-8"), digest_size=16).hexdigest()
 
-# ---------- LLM client (DeepSeek) ----------
 
-async def call_llm(contract_text: str) -> Dict:
+async def request_analysis(user_content: str) -> LLMAnalysis:
     """
-    Call DeepSeek API with system prompt from prompt.txt and contract text
-    as the user message. Return a JSON dict that matches make_dummy_analysis
-    output format (summary, categories, topRisks, document, etc.).
-
-    Here I assume your prompt instructs the model to produce exactly that JSON.
+    One DeepSeek round-trip: system prompt from prompt.txt plus `user_content`
+    as the user message, decoded into an LLMAnalysis.
     """
     if not DEEPSEEK_API_KEY:
         raise RuntimeError("DEEPSEEK_API_KEY env var not set")
 
-    messages = [
-        {
-            "role": "system",
-            "content": SYSTEM_PROMPT,
-        },
-        {
-            "role": "user",
-            "content": contract_text,
-        },
-    ]
-
     payload = {
         "model": DEEPSEEK_MODEL,
-        "messages": messages,
+        "messages": [SYSTEM_MESSAGE, {"role": "user", "content": user_content}],
+        "response_format": {"type": "json_object"},
         # Optionally:
-        # "response_format": {"type": "json_object"},
         # "temperature": 0.2,
     }
 
-    headers = {
-        "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.post(DEEPSEEK_API_URL, json=payload, headers=headers)
-        if resp.status_code != 200:
-            # Log or raise with more detail
-            raise HTTPException(
-                status_code=500,
-                detail=f"DeepSeek API error: {resp.status_code} {resp.text}",
-            )
-
-        data = resp.json()
+    # Encode with msgspec ourselves instead of letting httpx use stdlib json
+    resp = await HTTP_CLIENT.post(
+        DEEPSEEK_API_URL, content=JSON_ENCODER.encode(payload), headers=HEADERS
+    )
+    if resp.status_code != 200:
+        # Log or raise with more detail
+        raise HTTPException(
+            status_code=500,
+            detail=f"DeepSeek API error: {resp.status_code} {resp.text}",
+        )
 
     # Expecting something like OpenAI-style:
-    # data["choices"][0]["message"]["content"] -> JSON string
-    content = data["choices"][0]["message"]["content"]
-
-    # If model returns JSON as a string, parse it:
-    import json
+    # choices[0].message.content -> JSON string
+    # Decode the envelope straight from bytes, skipping everything else.
+    try:
+        completion = COMPLETION_DECODER.decode(resp.content)
+    except msgspec.DecodeError:
+        raise HTTPException(status_code=500, detail="Unexpected DeepSeek response")
+    if not completion.choices:
+        raise HTTPException(status_code=500, detail="DeepSeek returned no choices")
+    content = completion.choices[0].message.content
+
+    # If model returns JSON as a string, decode + validate it in one pass:
     try:
-        result = json.loads(content)
-    except json.JSONDecodeError:
+        return LLM_DECODER.decode(content)
+    except msgspec.DecodeError:
         # If it doesn't return valid JSON, you can either:
         # - raise an error, or
         # - fall back to some default structure
         raise HTTPException(status_code=500, detail="LLM returned invalid JSON")
 
+
+def split_contract(text: str, max_chars: int) -> List[str]:
+    """
+    Split into chunks of at most `max_chars`, breaking on paragraphs ("\n\n")
+    where possible, then on lines (PDF pages and DOCX paragraphs are joined
+    with a single "\n"); only a line longer than `max_chars` by itself is
+    cut, at its last space before the limit.
+    """
+    # (separator before, piece) -- every piece fits in a chunk on its own
+    pieces: List[Tuple[str, str]] = []
+    for p_i, para in enumerate(text.split("\n\n")):
+        lines = [para] if len(para) <= max_chars else para.split("\n")
+        for l_i, line in enumerate(lines):
+            sep = "\n" if l_i else ("\n\n" if p_i else "")
+            while len(line) > max_chars:
+                cut = line.rfind(" ", 1, max_chars + 1)
+                if cut > 0:
+                    pieces.append((sep, line[:cut]))
+                    line, sep = line[cut + 1:], " "
+                else:
+                    pieces.append((sep, line[:max_chars]))
+                    line, sep = line[max_chars:], ""
+            pieces.append((sep, line))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for sep, piece in pieces:
+        if current and size + len(sep) + len(piece) > max_chars:
+            chunks.append("".join(current))
+            current, size = [], 0
+        if current:
+            current.append(sep)
+            size += len(sep)
+        current.append(piece)
+        size += len(piece)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+RISK_RANK = {"low": 0, "medium": 1, "high": 2}
+
+
+def renumber(items: List[Any]) -> List[Any]:
+    return [msgspec.structs.replace(x, id=i) for i, x in enumerate(items, 1)]
+
+
+def merge_analyses(parts: List[LLMAnalysis]) -> LLMAnalysis:
+    """
+    Combine per-chunk analyses into one: counts add up, scores and risk
+    level take the worst chunk, lists are concatenated and re-numbered.
+    """
+    worst = max(
+        parts, key=lambda p: (RISK_RANK[p.summary.overallRisk], p.summary.riskScore)
+    )
+    summary = Summary(
+        overallRisk=worst.summary.overallRisk,
+        riskScore=worst.summary.riskScore,
+        criticalIssues=sum(p.summary.criticalIssues for p in parts),
+        mediumIssues=sum(p.summary.mediumIssues for p in parts),
+        lowIssues=sum(p.summary.lowIssues for p in parts),
+        recommendation=worst.summary.recommendation,
+    )
+
+    categories: Dict[str, int] = {}
+    for p in parts:
+        for c in p.categories:
+            categories[c.name] = max(c.value, categories.get(c.name, c.value))
+
+    # `document` isn't validated, so skip parts whose sections aren't a list
+    # and re-id copies rather than the decoded dicts.
+    raw_sections: List[Any] = []
+    for p in parts:
+        part_sections = p.document.get("sections")
+        if isinstance(part_sections, list):
+            raw_sections.extend(part_sections)
+    sections = [
+        {**s, "id": f"s{i}"} if isinstance(s, dict) else s
+        for i, s in enumerate(raw_sections, 1)
+    ]
+
+    first = parts[0].report
+    report = Report(
+        documentInfo=first.documentInfo,
+        executiveSummary=ExecutiveSummary(
+            overallRisk=summary.overallRisk,
+            riskScore=summary.riskScore,
+            criticalIssues=summary.criticalIssues,
+            mediumIssues=summary.mediumIssues,
+            lowIssues=summary.lowIssues,
+            recommendation=summary.recommendation,
+        ),
+        issues=renumber([i for p in parts for i in p.report.issues]),
+        mitigationPlan=list(dict.fromkeys(m for p in parts for m in p.report.mitigationPlan)),
+        signingRecommendation=worst.report.signingRecommendation,
+    )
+
+    return LLMAnalysis(
+        summary=summary,
+        categories=[CategoryScore(name=n, value=v) for n, v in categories.items()],
+        topRisks=renumber([r for p in parts for r in p.topRisks]),
+        document={**parts[0].document, "sections": sections},
+        improvements=renumber([i for p in parts for i in p.improvements]),
+        changes=renumber([c for p in parts for c in p.changes]),
+        report=report,
+    )
+
+
+async def call_llm(contract_text: str) -> LLMAnalysis:
+    """
+    Analyze the contract text with DeepSeek and return the decoded LLMAnalysis
+    (summary, categories, topRisks, document, etc.).
+
+    Here I assume your prompt instructs the model to produce exactly that JSON.
+    Contracts longer than LLM_CHUNK_CHARS are split into parts that are
+    analyzed concurrently (at most LLM_MAX_PARALLEL at once) and merged.
+    Results are cached per contract text, so re-uploading the same document
+    skips the API call.
+    """
+    key = contract_cache_key(contract_text)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if len(contract_text) <= LLM_CHUNK_CHARS:
+        result = await request_analysis(contract_text)
+    else:
+        chunks = split_contract(contract_text, LLM_CHUNK_CHARS)
+        semaphore = asyncio.Semaphore(LLM_MAX_PARALLEL)
+
+        async def analyze_part(n: int, chunk: str) -> LLMAnalysis:
+            async with semaphore:
+                return await request_analysis(
+                    f"[Part {n} of {len(chunks)} of the contract]\n\n{chunk}"
+                )
+
+        tasks = [
+            asyncio.create_task(analyze_part(n, chunk))
+            for n, chunk in enumerate(chunks, 1)
+        ]
+        try:
+            parts = await asyncio.gather(*tasks)
+        except BaseException:
+            # One part failed (or the request was cancelled): don't keep paying
+            # for the others. Reap them so their errors aren't left unretrieved;
+            # the original exception (e.g. the HTTPException) propagates as is.
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        result = merge_analyses(parts)
+
+    LLM_CACHE[key] = result
     return result
 
 
 # ---------- Text extraction ----------
 
-def extract_text_from_file(upload: UploadFile) -> str:
-    filename = upload.filename or ""
+def extract_text_from_file(filename: str, f: BinaryIO) -> str:
+    """
+    Blocking, CPU-bound parsing of the uploaded file. Run it through
+    run_in_threadpool so it doesn't stall the event loop.
+
+    `f` is the upload's SpooledTemporaryFile; the parsers read it directly
+    rather than from a bytes copy wrapped in BytesIO.
+    """
     ext = filename.lower().split(".")[-1]
-    data = upload.file.read()
 
     if ext == "txt":
-        return data.decode("utf-8", errors="ignore")
+        return f.read().decode("utf-8", errors="ignore")
 
     if ext == "pdf":
-        from io import BytesIO
         from pypdf import PdfReader
 
-        reader = PdfReader(BytesIO(data))
-        return "\n".join(page.extract_text() or "" for page in reader.pages)
+        reader = PdfReader(f)
+        parts: List[str] = []
+        append = parts.append
+        for page in reader.pages:
+            append(page.extract_text() or "")
+        return "\n".join(parts)
 
     if ext in ("docx", "doc"):
-        from io import BytesIO
         import docx
 
-        doc = docx.Document(BytesIO(data))
+        doc = docx.Document(f)
         return "\n".join(p.text for p in doc.paragraphs)
 
     raise HTTPException(status_code=400, detail="Unsupported file type")
@@ -259,28 +338,85 @@ def extract_text_from_file(upload: UploadFile) -> str:
 
 # ---------- App + in-memory store ----------
 
-app = FastAPI(title="RedGuard Backend", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global HTTP_CLIENT
+    HTTP_CLIENT = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    )
+    try:
+        yield
+    finally:
+        await HTTP_CLIENT.aclose()
+        HTTP_CLIENT = None
+
+
+app = FastAPI(
+    title="RedGuard Backend",
+    version="0.1.0",
+    lifespan=lifespan,
+)
 
 app.add_middleware(
-    CORSMiddleware,
+    FastPathCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-CONTRACTS: Dict[str, ContractAnalysis] = {}
-FEEDBACK: Dict[str, List[FeedbackRequest]] = {}
+# FastAPI only knows how to document Pydantic models, so the Struct schemas are
+# generated by msgspec and merged into the OpenAPI components.
+STRUCT_SCHEMAS: Dict[str, Any] = {}
+
+
+def struct_responses(struct_type: type) -> Dict[int, Dict[str, Any]]:
+    (schema,), components = msgspec.json.schema_components(
+        [struct_type], ref_template="#/components/schemas/{name}"
+    )
+    STRUCT_SCHEMAS.update(components)
+    return {200: {"content": {"application/json": {"schema": schema}}}}
+
+
+def custom_openapi() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            routes=app.routes,
+        )
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(STRUCT_SCHEMAS)
+        app.openapi_schema = schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
 
+class StoredContract(NamedTuple):
+    item: ContractListItem  # built once at upload so listing is a plain scan
+    analysis: ContractAnalysis
+    feedback: List[FeedbackRequest]  # lives and is evicted with its contract
 
-@app.get("/healthz", response_model=HealthResponse)
-async def healthz():
-    return HealthResponse()
 
+# Each analysis embeds the full contract text, so keep only the most recently
+# used ones instead of growing until the pod is OOM-killed.
+CONTRACTS: LRUCache = LRUCache(maxsize=CONTRACTS_CACHE_SIZE)  # str -> StoredContract
 
-@app.post("/api/contracts/analyze", response_model=ContractAnalysis)
+
+# Liveness probes hit this constantly: mount a prebuilt Response directly as
+# the route's ASGI app (no FastAPI dependency resolution / validation). Going
+# through a handler function would break under the Cython build, since
+# Starlette only wraps endpoints that inspect.isfunction() recognizes.
+HEALTH_RESPONSE = Response(b'{"status":"ok"}', media_type="application/json")
+
+app.add_route("/healthz", HEALTH_RESPONSE, methods=["GET"], include_in_schema=False)
+
+
+@app.post("/api/contracts/analyze", responses=struct_responses(ContractAnalysis))
 async def analyze_contract(file: UploadFile = File(...)):
-    text = extract_text_from_file(file)
+    text = await run_in_threadpool(extract_text_from_file, file.filename or "", file.file)
 
     if len(text) < 50:
         raise HTTPException(status_code=400, detail="Document too short")
@@ -289,50 +425,52 @@ async def analyze_contract(file: UploadFile = File(...)):
     llm_result = await call_llm(text)
 
     contract_id = str(uuid4())
-    uploaded_at = datetime.utcnow().isoformat() + "Z"
+    uploaded_at = utc_now()  # encoded as ISO 8601 with "Z"
 
     analysis = ContractAnalysis(
         contractId=contract_id,
         fileName=file.filename or "document",
         uploadedAt=uploaded_at,
-        summary=Summary(**llm_result["summary"]),
-        categories=[CategoryScore(**c) for c in llm_result.get("categories", [])],
-        topRisks=[TopRisk(**r) for r in llm_result.get("topRisks", [])],
-        document=llm_result.get("document", {}),
-        improvements=[Improvement(**imp) for imp in llm_result.get("improvements", [])],
-        changes=[Change(**ch) for ch in llm_result.get("changes", [])],
-        report=Report(**llm_result["report"]),
+        summary=llm_result.summary,
+        categories=llm_result.categories,
+        topRisks=llm_result.topRisks,
+        document=llm_result.document,
+        improvements=llm_result.improvements,
+        changes=llm_result.changes,
+        report=llm_result.report,
     )
-    CONTRACTS[contract_id] = analysis
-    return analysis
+    item = ContractListItem(
+        contractId=contract_id,
+        fileName=analysis.fileName,
+        uploadedAt=uploaded_at,
+        overallRisk=analysis.summary.overallRisk,
+        riskScore=analysis.summary.riskScore,
+    )
+    CONTRACTS[contract_id] = StoredContract(item, analysis, [])
+    return struct_response(analysis)
 
 
-@app.get("/api/contracts", response_model=ContractListResponse)
+@app.get("/api/contracts", responses=struct_responses(ContractListResponse))
 async def list_contracts():
-    items = [
-        ContractListItem(
-            contractId=cid,
-            fileName=contract.fileName,
-            uploadedAt=contract.uploadedAt,
-            overallRisk=contract.summary.overallRisk,
-            riskScore=contract.summary.riskScore,
-        )
-        for cid, contract in CONTRACTS.items()
-    ]
-    return ContractListResponse(items=items)
+    # CONTRACTS.values()/[] would mark every entry as used on each poll and turn
+    # the LRU into FIFO; read through the base Cache so only get_contract and
+    # feedback refresh recency.
+    items = [Cache.__getitem__(CONTRACTS, cid).item for cid in CONTRACTS]
+    return struct_response(ContractListResponse(items=items))
 
 
-@app.get("/api/contracts/{contract_id}", response_model=ContractAnalysis)
+@app.get("/api/contracts/{contract_id}", responses=struct_responses(ContractAnalysis))
 async def get_contract(contract_id: str):
-    contract = CONTRACTS.get(contract_id)
-    if not contract:
+    stored = CONTRACTS.get(contract_id)
+    if not stored:
         raise HTTPException(status_code=404, detail="Contract not found")
-    return contract
+    return struct_response(stored.analysis)
 
 
 @app.post("/api/contracts/{contract_id}/feedback")
 async def submit_feedback(contract_id: str, feedback: FeedbackRequest):
-    if contract_id not in CONTRACTS:
+    stored = CONTRACTS.get(contract_id)
+    if not stored:
         raise HTTPException(status_code=404, detail="Contract not found")
-    FEEDBACK.setdefault(contract_id, []).append(feedback)
+    stored.feedback.append(feedback)
     return {"status": "ok"}
@@ -0,0 +1,51 @@
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ---------- CORS ----------
+
+VARY_ORIGIN = (b"vary", b"Origin")
+
+
+def add_vary_origin(raw_headers) -> list:
+    """
+    Append "Origin" to the response's Vary header, folding any existing Vary
+    entries into one the same way CORSMiddleware does.
+    """
+    headers = list(raw_headers)
+    vary = [value for name, value in headers if name.lower() == b"vary"]
+    if not vary:
+        headers.append(VARY_ORIGIN)
+        return headers
+    headers = [(name, value) for name, value in headers if name.lower() != b"vary"]
+    headers.append((b"vary", b", ".join([*vary, b"Origin"])))
+    return headers
+
+
+class FastPathCORSMiddleware:
+    """
+    Wraps Starlette's CORSMiddleware but only runs it for requests that carry
+    an Origin header. Probes and server-to-server calls never do, so they skip
+    the header parsing and just get the `Vary: Origin` CORSMiddleware would
+    have added, merged into the raw headers directly.
+    """
+
+    def __init__(self, app: ASGIApp, **cors_options) -> None:
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, _ in scope["headers"]:
+            if name == b"origin":
+                await self.cors(scope, receive, send)
+                return
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = add_vary_origin(message.get("headers", ()))
+            await send(message)
+
+        await self.app(scope, receive, send_with_vary)
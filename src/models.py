@@ -0,0 +1,180 @@
+from typing import Annotated, Any, Dict, List, Literal, Optional
+from datetime import datetime
+
+import msgspec
+from pydantic import BaseModel, ConfigDict
+
+# ---------- Models ----------
+# Response/LLM schemas are msgspec Structs: DeepSeek's JSON is decoded straight
+# into them and they are encoded straight to bytes. Pydantic is only used for
+# request bodies (FeedbackRequest).
+
+RiskLevel = Literal["low", "medium", "high"]
+
+
+class FrozenStruct(msgspec.Struct, frozen=True, gc=False):
+    """
+    Base for all Structs. Instances are never mutated after decoding (use
+    msgspec.structs.replace) and never form reference cycles, so they can be
+    frozen and left out of GC tracking.
+    """
+
+
+class CategoryScore(FrozenStruct):
+    name: str
+    value: int
+
+
+class TopRisk(FrozenStruct):
+    id: int
+    level: RiskLevel
+    category: str
+    title: str
+    description: str
+    section: Optional[str] = None
+    impact: Optional[str] = None
+    recommendation: Optional[str] = None
+    tags: List[str] = []
+
+
+class Summary(FrozenStruct):
+    overallRisk: RiskLevel
+    riskScore: Annotated[int, msgspec.Meta(ge=0, le=100)]
+    criticalIssues: int
+    mediumIssues: int
+    lowIssues: int
+    recommendation: str
+
+
+class IssueDetail(FrozenStruct):
+    id: str
+    type: str
+    severity: RiskLevel
+    snippet: str
+    explanation: str
+    suggestedFix: Optional[str] = None
+
+
+class Section(FrozenStruct, kw_only=True):
+    id: str
+    heading: Optional[str] = None
+    text: str
+    riskLevel: RiskLevel
+    riskTags: List[str] = []
+    issues: List[IssueDetail] = []
+
+
+class DocumentInfo(FrozenStruct):
+    name: str
+    date: Optional[str] = None
+    parties: List[str] = []
+    reviewDate: Optional[str] = None
+    analyst: Optional[str] = None
+
+
+class ReportIssue(FrozenStruct):
+    id: int
+    category: str
+    severity: str
+    title: str
+    status: str
+    owner: Optional[str] = None
+    dueDate: Optional[str] = None
+
+
+class ExecutiveSummary(FrozenStruct):
+    overallRisk: str
+    riskScore: int
+    criticalIssues: int
+    mediumIssues: int
+    lowIssues: int
+    recommendation: str
+
+
+class Report(FrozenStruct):
+    documentInfo: DocumentInfo
+    executiveSummary: ExecutiveSummary
+    issues: List[ReportIssue]
+    mitigationPlan: List[str]
+    signingRecommendation: str
+
+
+class Improvement(FrozenStruct):
+    id: int
+    category: str
+    level: RiskLevel
+    original: str
+    improved: str
+    rationale: str
+    status: Literal["suggested", "accepted", "rejected"] = "suggested"
+
+
+class Change(FrozenStruct, kw_only=True):
+    id: int
+    type: Literal["added", "removed", "modified"]
+    section: str
+    original: Optional[str] = None
+    revised: Optional[str] = None
+    impact: RiskLevel
+    description: str
+    status: str
+
+
+class LLMAnalysis(FrozenStruct, kw_only=True):
+    """The part of ContractAnalysis produced by the model (see prompt.txt)."""
+    summary: Summary
+    categories: List[CategoryScore] = []
+    topRisks: List[TopRisk] = []
+    document: Dict[str, Any] = {}
+    improvements: List[Improvement] = []
+    changes: List[Change] = []
+    report: Report
+
+
+class ContractAnalysis(FrozenStruct):
+    contractId: str
+    fileName: str
+    uploadedAt: datetime
+    summary: Summary
+    categories: List[CategoryScore]
+    topRisks: List[TopRisk]
+    document: Dict[str, Any]
+    improvements: List[Improvement]
+    changes: List[Change]
+    report: Report
+
+
+class ContractListItem(FrozenStruct):
+    contractId: str
+    fileName: str
+    uploadedAt: datetime
+    overallRisk: RiskLevel
+    riskScore: int
+
+
+class ContractListResponse(FrozenStruct):
+    items: List[ContractListItem]
+
+
+class FeedbackRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    issueId: str
+    type: Literal["false_positive", "helpful", "not_helpful"]
+    comment: Optional[str] = None
+
+
+# ---------- DeepSeek API ----------
+# Only the fields we read from the OpenAI-style chat completion envelope;
+# everything else (usage, ids, ...) is skipped by the decoder.
+
+class ChatMessage(FrozenStruct):
+    content: str = ""
+
+
+class ChatChoice(FrozenStruct):
+    message: ChatMessage
+
+
+class ChatCompletion(FrozenStruct):
+    choices: List[ChatChoice] = []
@@ -0,0 +1,42 @@
+import os
+
+os.environ.setdefault(
+    "PROMPT_PATH", os.path.join(os.path.dirname(__file__), "..", "src", "prompt.txt")
+)
+
+from src.main import split_contract  # noqa: E402
+
+
+def test_newline_only_text_splits_on_line_boundaries():
+    # PDF pages and DOCX paragraphs are joined with a single "\n"
+    lines = [f"Clause {i}. Each party shall indemnify the other party for losses." for i in range(2000)]
+    text = "\n".join(lines)
+
+    chunks = split_contract(text, 40000)
+
+    assert len(chunks) > 1
+    assert all(len(c) <= 40000 for c in chunks)
+    assert "\n".join(chunks) == text
+    for chunk in chunks:
+        assert chunk.startswith("Clause ")
+        assert chunk.endswith("for losses.")
+
+
+def test_prefers_paragraph_boundaries():
+    text = "a" * 50 + "\n\n" + "b" * 50 + "\n\n" + "c" * 50
+
+    assert split_contract(text, 110) == ["a" * 50 + "\n\n" + "b" * 50, "c" * 50]
+
+
+def test_long_line_is_cut_at_last_space():
+    text = "word " * 30
+
+    chunks = split_contract(text.strip(), 22)
+
+    assert all(len(c) <= 22 for c in chunks)
+    assert all(c.replace("word", "").strip() == "" for c in chunks)
+    assert " ".join(chunks) == text.strip()
+
+
+def test_line_without_spaces_is_hard_cut():
+    assert split_contract("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]